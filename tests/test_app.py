@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+import app
+
+
+def test_compute_index_constant_column_is_nan():
+    X = np.array([[1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                  [2.0, 2.0, 4.0, 5.0, 6.0, 7.0]])
+    norm, index = app.compute_index(X, app.INDEX_WEIGHTS)
+    assert np.isnan(norm[:, 1]).all()
+    assert np.allclose(norm[:, 0], [0.0, 1.0])
+    assert np.isnan(index).all()
+
+
+def test_compute_index_single_row():
+    norm, index = app.compute_index(np.array([[1.0, 2.0, 3.0, 4.0, 5.0, 6.0]]), app.INDEX_WEIGHTS)
+    assert norm.shape == (1, 6)
+    assert np.isnan(norm).all()
+    assert np.isnan(index).all()
+
+
+def test_calculate_index_equal_metrics_keeps_rows():
+    df = pd.DataFrame({'state': ['a', 'b'], **{name: [1.0, 1.0] for name in app.INDEX_COLUMNS}})
+    result = app.calculate_index(df)
+    assert len(result) == 2
+    assert result['index'].isna().all()
+
+
+def test_calculate_index_requires_state():
+    df = pd.DataFrame({name: [1.0, 2.0] for name in app.INDEX_COLUMNS})
+    assert app.calculate_index(df).empty